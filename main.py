@@ -1,23 +1,27 @@
+import atexit
 import base64
+import binascii
+import functools
+import hashlib
+import json
+import operator
+import os
 import sys
+import tempfile
 from pathlib import Path
 import traceback
-from typing import List, Optional, Tuple, Dict
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Pattern, Tuple
 from datetime import datetime
 
 import click
-import inquirer
 import yaml
-from selenium import webdriver
-from selenium.common.exceptions import WebDriverException
-from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
 import re
-from src.libs.resume_and_cover_builder import ResumeFacade, ResumeGenerator, StyleManager
-from src.resume_schemas.job_application_profile import JobApplicationProfile
-from src.resume_schemas.resume import Resume
+try:
+    # google-re2 matches in linear time without backtracking; optional
+    import re2
+except ImportError:
+    re2 = re
 from src.logging import logger
-from src.utils.chrome_utils import init_browser
 from src.utils.constants import (
     PLAIN_TEXT_RESUME_YAML,
     SECRETS_YAML,
@@ -27,173 +31,280 @@ from src.utils.constants import (
 # from ai_hawk.job_manager import AIHawkJobManager
 # from ai_hawk.llm.llm_manager import GPTAnswerer
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 class ConfigError(Exception):
     """Custom exception for configuration-related errors."""
     pass
 
 
-class ConfigValidator:
-    """Validates configuration and secrets YAML files."""
-
-    EMAIL_REGEX = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
-    REQUIRED_CONFIG_KEYS = {
-        "remote": bool,
-        "experience_level": dict,
-        "job_types": dict,
-        "date": dict,
-        "positions": list,
-        "locations": list,
-        "location_blacklist": list,
-        "distance": int,
-        "company_blacklist": list,
-        "title_blacklist": list,
-    }
-    EXPERIENCE_LEVELS = [
-        "internship",
-        "entry",
-        "associate",
-        "mid_senior_level",
-        "director",
-        "executive",
-    ]
-    JOB_TYPES = [
-        "full_time",
-        "contract",
-        "part_time",
-        "temporary",
-        "internship",
-        "other",
-        "volunteer",
-    ]
-    DATE_FILTERS = ["all_time", "month", "week", "24_hours"]
-    APPROVED_DISTANCES = {0, 5, 10, 25, 50, 100}
+# Configuration validation
+EMAIL_REGEX: Pattern[str] = re2.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+REQUIRED_CONFIG_KEYS: Dict[str, type] = {
+    "remote": bool,
+    "experience_level": dict,
+    "job_types": dict,
+    "date": dict,
+    "positions": list,
+    "locations": list,
+    "location_blacklist": list,
+    "distance": int,
+    "company_blacklist": list,
+    "title_blacklist": list,
+}
+EXPERIENCE_LEVELS: Tuple[str, ...] = (
+    "internship",
+    "entry",
+    "associate",
+    "mid_senior_level",
+    "director",
+    "executive",
+)
+JOB_TYPES: Tuple[str, ...] = (
+    "full_time",
+    "contract",
+    "part_time",
+    "temporary",
+    "internship",
+    "other",
+    "volunteer",
+)
+DATE_FILTERS: Tuple[str, ...] = ("all_time", "month", "week", "24_hours")
+APPROVED_DISTANCES: FrozenSet[int] = frozenset({0, 5, 10, 25, 50, 100})
+BLACKLIST_KEYS: Tuple[str, ...] = ("company_blacklist", "title_blacklist", "location_blacklist")
+BOOL_SECTIONS: Tuple[Tuple[str, str, Tuple[str, ...]], ...] = (
+    ("experience_level", "Experience level", EXPERIENCE_LEVELS),
+    ("job_types", "Job type", JOB_TYPES),
+    ("date", "Date filter", DATE_FILTERS),
+)
 
-    @staticmethod
-    def validate_email(email: str) -> bool:
-        """Validate the format of an email address."""
-        return bool(ConfigValidator.EMAIL_REGEX.match(email))
+# A compiled check is (getter, predicate, message); message is formatted with the
+# offending value and the config path when the predicate fails
+ConfigCheck = Tuple[Callable[[dict], Any], Callable[[Any], bool], str]
 
-    @staticmethod
-    def load_yaml(yaml_path: Path) -> dict:
-        """Load and parse a YAML file."""
-        try:
-            with open(yaml_path, "r") as stream:
-                return yaml.safe_load(stream)
-        except yaml.YAMLError as exc:
-            raise ConfigError(f"Error reading YAML file {yaml_path}: {exc}")
-        except FileNotFoundError:
-            raise ConfigError(f"YAML file not found: {yaml_path}")
-
-    @classmethod
-    def validate_config(cls, config_yaml_path: Path) -> dict:
-        """Validate the main configuration YAML file."""
-        parameters = cls.load_yaml(config_yaml_path)
-        # Check for required keys and their types
-        for key, expected_type in cls.REQUIRED_CONFIG_KEYS.items():
-            if key not in parameters:
-                if key in ["company_blacklist", "title_blacklist", "location_blacklist"]:
-                    parameters[key] = []
-                else:
-                    raise ConfigError(f"Missing required key '{key}' in {config_yaml_path}")
-            elif not isinstance(parameters[key], expected_type):
-                if key in ["company_blacklist", "title_blacklist", "location_blacklist"] and parameters[key] is None:
-                    parameters[key] = []
-                else:
-                    raise ConfigError(
-                        f"Invalid type for key '{key}' in {config_yaml_path}. Expected {expected_type.__name__}."
-                    )
-        cls._validate_experience_levels(parameters["experience_level"], config_yaml_path)
-        cls._validate_job_types(parameters["job_types"], config_yaml_path)
-        cls._validate_date_filters(parameters["date"], config_yaml_path)
-        cls._validate_list_of_strings(parameters, ["positions", "locations"], config_yaml_path)
-        cls._validate_distance(parameters["distance"], config_yaml_path)
-        cls._validate_blacklists(parameters, config_yaml_path)
-        return parameters
-
-    @classmethod
-    def _validate_experience_levels(cls, experience_levels: dict, config_path: Path):
-        """Ensure experience levels are booleans."""
-        for level in cls.EXPERIENCE_LEVELS:
-            if not isinstance(experience_levels.get(level), bool):
-                raise ConfigError(
-                    f"Experience level '{level}' must be a boolean in {config_path}"
-                )
+def _is_bool(value: Any) -> bool:
+    return isinstance(value, bool)
 
-    @classmethod
-    def _validate_job_types(cls, job_types: dict, config_path: Path):
-        """Ensure job types are booleans."""
-        for job_type in cls.JOB_TYPES:
-            if not isinstance(job_types.get(job_type), bool):
-                raise ConfigError(
-                    f"Job type '{job_type}' must be a boolean in {config_path}"
-                )
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list)
 
-    @classmethod
-    def _validate_date_filters(cls, date_filters: dict, config_path: Path):
-        """Ensure date filters are booleans."""
-        for date_filter in cls.DATE_FILTERS:
-            if not isinstance(date_filters.get(date_filter), bool):
-                raise ConfigError(
-                    f"Date filter '{date_filter}' must be a boolean in {config_path}"
-                )
+def _is_list_of_strings(value: Any) -> bool:
+    return all(type(item) is str for item in value)
 
-    @classmethod
-    def _validate_list_of_strings(cls, parameters: dict, keys: list, config_path: Path):
-        """Ensure specified keys are lists of strings."""
+def _is_approved_distance(value: Any) -> bool:
+    return value in APPROVED_DISTANCES
+
+def _get_section_key(section: str, key: str) -> Callable[[dict], Any]:
+    return lambda parameters: parameters[section].get(key)
+
+def _compile_config_checks() -> Tuple[ConfigCheck, ...]:
+    """
+    Flatten every per-value rule of the schema into a single list of checks.
+
+    Runs once at import, so validate_config executes one straight pass over the
+    table instead of a separate loop per section.
+    """
+    checks: List[ConfigCheck] = []
+    for section, label, keys in BOOL_SECTIONS:
         for key in keys:
-            if not all(isinstance(item, str) for item in parameters[key]):
+            checks.append(
+                (_get_section_key(section, key), _is_bool, f"{label} '{key}' must be a boolean in {{path}}")
+            )
+    for key in ("positions", "locations"):
+        checks.append(
+            (operator.itemgetter(key), _is_list_of_strings, f"'{key}' must be a list of strings in {{path}}")
+        )
+    checks.append(
+        (
+            operator.itemgetter("distance"),
+            _is_approved_distance,
+            "Invalid distance value '{value}' in {path}. Must be one of: " + str(sorted(APPROVED_DISTANCES)),
+        )
+    )
+    for blacklist in BLACKLIST_KEYS:
+        checks.append((operator.itemgetter(blacklist), _is_list, f"'{blacklist}' must be a list in {{path}}"))
+    return tuple(checks)
+
+CONFIG_CHECKS: Tuple[ConfigCheck, ...] = _compile_config_checks()
+
+CONFIG_CACHE_FILE: str = "config.json"
+# Bump when validation logic changes in a way the schema constants below don't capture
+CONFIG_CACHE_VERSION: int = 1
+# Identifies the validator that produced a cache entry; entries with another tag are ignored
+CONFIG_CACHE_TAG: str = hashlib.blake2b(
+    repr(
+        (CONFIG_CACHE_VERSION, REQUIRED_CONFIG_KEYS, BLACKLIST_KEYS, [message for _, _, message in CONFIG_CHECKS])
+    ).encode(),
+    digest_size=8,
+).hexdigest()
+
+def validate_email(email: str) -> bool:
+    """Validate the format of an email address."""
+    return bool(EMAIL_REGEX.match(email))
+
+def load_yaml(yaml_path: Path) -> Any:
+    """Load and parse a YAML file."""
+    try:
+        # Hand libyaml the raw bytes so it can skip the str decode/re-encode
+        with open(yaml_path, "rb") as stream:
+            return parse_yaml(stream.read(), yaml_path)
+    except FileNotFoundError:
+        raise ConfigError(f"YAML file not found: {yaml_path}")
+
+def parse_yaml(content: bytes, yaml_path: Path) -> Any:
+    """Parse YAML content previously read from yaml_path."""
+    try:
+        return yaml.load(content, Loader=Loader)
+    except yaml.YAMLError as exc:
+        raise ConfigError(f"Error reading YAML file {yaml_path}: {exc}")
+
+def validate_config(config_yaml_path: Path) -> dict:
+    """Validate the main configuration YAML file."""
+    return _validate_parameters(load_yaml(config_yaml_path), config_yaml_path)
+
+def _validate_parameters(parameters: dict, config_yaml_path: Path) -> dict:
+    """Validate and normalise configuration parameters parsed from config_yaml_path."""
+    # Check for required keys and their types
+    for key, expected_type in REQUIRED_CONFIG_KEYS.items():
+        if key not in parameters:
+            if key in BLACKLIST_KEYS:
+                parameters[key] = []
+            else:
+                raise ConfigError(f"Missing required key '{key}' in {config_yaml_path}")
+        elif not isinstance(parameters[key], expected_type):
+            if key in BLACKLIST_KEYS and parameters[key] is None:
+                parameters[key] = []
+            else:
                 raise ConfigError(
-                    f"'{key}' must be a list of strings in {config_path}"
+                    f"Invalid type for key '{key}' in {config_yaml_path}. Expected {expected_type.__name__}."
                 )
+    for getter, predicate, message in CONFIG_CHECKS:
+        value = getter(parameters)
+        if not predicate(value):
+            raise ConfigError(message.format(value=value, path=config_yaml_path))
+    return parameters
 
-    @classmethod
-    def _validate_distance(cls, distance: int, config_path: Path):
-        """Validate the distance value."""
-        if distance not in cls.APPROVED_DISTANCES:
-            raise ConfigError(
-                f"Invalid distance value '{distance}' in {config_path}. Must be one of: {cls.APPROVED_DISTANCES}"
-            )
+def validate_config_cached(config_yaml_path: Path, cache_dir: Path) -> dict:
+    """
+    Validate the main configuration YAML file, reusing the result of a previous run.
 
-    @classmethod
-    def _validate_blacklists(cls, parameters: dict, config_path: Path):
-        """Ensure blacklists are lists."""
-        for blacklist in ["company_blacklist", "title_blacklist", "location_blacklist"]:
-            if not isinstance(parameters.get(blacklist), list):
-                raise ConfigError(
-                    f"'{blacklist}' must be a list in {config_path}"
-                )
-            if parameters[blacklist] is None:
-                parameters[blacklist] = []
+    The validated parameters are stored as JSON in ``cache_dir`` together with a
+    digest of the file's bytes and CONFIG_CACHE_TAG. When both match, parsing and
+    validation are skipped; any change to the file or to the schema revalidates.
+    """
+    try:
+        content = config_yaml_path.read_bytes()
+    except FileNotFoundError:
+        raise ConfigError(f"YAML file not found: {config_yaml_path}")
+    content_digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+    cache_file = cache_dir / CONFIG_CACHE_FILE
+
+    try:
+        with open(cache_file, "r", encoding="utf-8") as stream:
+            cached = json.load(stream)
+        if cached["tag"] == CONFIG_CACHE_TAG and cached["digest"] == content_digest:
+            return cached["parameters"]
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {cache_file}: {e}")
+
+    parameters = _validate_parameters(parse_yaml(content, config_yaml_path), config_yaml_path)
+
+    try:
+        serialized = json.dumps(
+            {"tag": CONFIG_CACHE_TAG, "digest": content_digest, "parameters": parameters}
+        )
+        # Only cache configs that survive the JSON round trip unchanged
+        if json.loads(serialized)["parameters"] == parameters:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, "w", encoding="utf-8") as stream:
+                stream.write(serialized)
+    except (TypeError, ValueError, OSError) as e:
+        logger.debug(f"Could not write config cache {cache_file}: {e}")
+    return parameters
+
+def validate_secrets(secrets_yaml_path: Path) -> str:
+    """Validate the secrets YAML file and retrieve the LLM API key."""
+    secrets = load_yaml(secrets_yaml_path)
+    mandatory_secrets = ["llm_api_key"]
+
+    for secret in mandatory_secrets:
+        if secret not in secrets:
+            raise ConfigError(f"Missing secret '{secret}' in {secrets_yaml_path}")
+
+        if not secrets[secret]:
+            raise ConfigError(f"Secret '{secret}' cannot be empty in {secrets_yaml_path}")
+
+    return secrets["llm_api_key"]
+
+
+class ConfigValidator:
+    """
+    Validates configuration and secrets YAML files.
+
+    Thin namespace over the module-level validation functions and constants,
+    kept so existing ``ConfigValidator.<name>`` callers continue to work.
+    """
+
+    EMAIL_REGEX: ClassVar[Pattern[str]] = EMAIL_REGEX
+    REQUIRED_CONFIG_KEYS: ClassVar[Dict[str, type]] = REQUIRED_CONFIG_KEYS
+    EXPERIENCE_LEVELS: ClassVar[Tuple[str, ...]] = EXPERIENCE_LEVELS
+    JOB_TYPES: ClassVar[Tuple[str, ...]] = JOB_TYPES
+    DATE_FILTERS: ClassVar[Tuple[str, ...]] = DATE_FILTERS
+    APPROVED_DISTANCES: ClassVar[FrozenSet[int]] = APPROVED_DISTANCES
 
     @staticmethod
-    def validate_secrets(secrets_yaml_path: Path) -> str:
-        """Validate the secrets YAML file and retrieve the LLM API key."""
-        secrets = ConfigValidator.load_yaml(secrets_yaml_path)
-        mandatory_secrets = ["llm_api_key"]
+    def validate_email(email: str) -> bool:
+        return validate_email(email)
 
-        for secret in mandatory_secrets:
-            if secret not in secrets:
-                raise ConfigError(f"Missing secret '{secret}' in {secrets_yaml_path}")
+    @staticmethod
+    def load_yaml(yaml_path: Path) -> Any:
+        return load_yaml(yaml_path)
 
-            if not secrets[secret]:
-                raise ConfigError(f"Secret '{secret}' cannot be empty in {secrets_yaml_path}")
+    @staticmethod
+    def parse_yaml(content: bytes, yaml_path: Path) -> Any:
+        return parse_yaml(content, yaml_path)
 
-        return secrets["llm_api_key"]
+    @staticmethod
+    def validate_config(config_yaml_path: Path) -> dict:
+        return validate_config(config_yaml_path)
+
+    @staticmethod
+    def validate_config_cached(config_yaml_path: Path, cache_dir: Path) -> dict:
+        return validate_config_cached(config_yaml_path, cache_dir)
+
+    @staticmethod
+    def validate_secrets(secrets_yaml_path: Path) -> str:
+        return validate_secrets(secrets_yaml_path)
 
 
 class FileManager:
     """Handles file system operations and validations."""
 
-    REQUIRED_FILES = [SECRETS_YAML, WORK_PREFERENCES_YAML, PLAIN_TEXT_RESUME_YAML]
+    REQUIRED_FILES: ClassVar[Tuple[str, ...]] = (SECRETS_YAML, WORK_PREFERENCES_YAML, PLAIN_TEXT_RESUME_YAML)
 
     @staticmethod
     def validate_data_folder(app_data_folder: Path) -> Tuple[Path, Path, Path, Path]:
         """Validate the existence of the data folder and required files."""
-        if not app_data_folder.is_dir():
+        # A single directory listing replaces one stat call per required file; names not
+        # listed verbatim (e.g. different case on case-insensitive filesystems) or an
+        # unreadable folder fall back to an exists() check
+        try:
+            with os.scandir(app_data_folder) as entries:
+                entry_names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
             raise FileNotFoundError(f"Data folder not found: {app_data_folder}")
+        except PermissionError:
+            entry_names = set()
 
-        missing_files = [file for file in FileManager.REQUIRED_FILES if not (app_data_folder / file).exists()]
+        missing_files = [
+            file
+            for file in FileManager.REQUIRED_FILES
+            if file not in entry_names and not (app_data_folder / file).exists()
+        ]
         if missing_files:
             raise FileNotFoundError(f"Missing files in data folder: {', '.join(missing_files)}")
 
@@ -218,12 +329,23 @@ class FileManager:
         return uploads
 
 
+# Directory (inside the output folder) holding validation results reused across runs
+VALIDATOR_CACHE_DIR = ".validator_cache"
+
+# Number of base64 characters decoded per write; must be a multiple of 4
+PDF_DECODE_CHUNK_SIZE = 64 * 1024
+BASE64_IGNORED_CHARS = re.compile(r"[^A-Za-z0-9+/=]")
+
+# Browser driver reused across document generations, see get_driver()
+_DRIVER = None
+
 # Action and style mappings
 ACTION_MAPPING = {
     "resume": "Generate Resume",
     "job": "Generate Resume Tailored for Job Description",
     "cover": "Generate Tailored Cover Letter for Job Description"
 }
+ACTION_MAPPING_INVERSE = {v: k for k, v in ACTION_MAPPING.items()}
 
 STYLE_MAPPING = {
     "clean-blue": "Clean Blue",
@@ -239,6 +361,8 @@ def prompt_user_action() -> str:
 
     :return: Selected action.
     """
+    import inquirer
+
     try:
         questions = [
             inquirer.List(
@@ -263,6 +387,8 @@ def prompt_style_selection(style_manager):
     :param style_manager: The StyleManager instance
     :return: The selected style name or None if no selection
     """
+    import inquirer
+
     available_styles = style_manager.get_styles()
     if not available_styles:
         logger.warning("No styles available. Proceeding without style selection.")
@@ -270,6 +396,8 @@ def prompt_style_selection(style_manager):
     
     # Present style choices to the user
     choices = style_manager.format_choices(available_styles)
+    # format_choices keeps the order of available_styles, so map each rendered choice back to its style
+    choice_to_style = dict(zip(choices, available_styles))
     questions = [
         inquirer.List(
             "style",
@@ -279,10 +407,7 @@ def prompt_style_selection(style_manager):
     ]
     style_answer = inquirer.prompt(questions)
     if style_answer and "style" in style_answer:
-        selected_choice = style_answer["style"]
-        for style_name, (file_name, author_link) in available_styles.items():
-            if selected_choice.startswith(style_name):
-                return style_name
+        return choice_to_style.get(style_answer["style"])
     return None
 
 def get_output_filename(action, style, custom_filename=None):
@@ -298,64 +423,183 @@ def get_output_filename(action, style, custom_filename=None):
         return custom_filename
     
     # Map action to short name for filename
-    action_name = next((k for k, v in ACTION_MAPPING.items() if v == action), "output")
+    action_name = ACTION_MAPPING_INVERSE.get(action, "output")
     
     # Get timestamp
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
     return f"{action_name}_{style}_{timestamp}.pdf"
 
-def create_resume_pdf(parameters: dict, llm_api_key: str, style_name=None, output_filename=None):
+def prompt_job_url() -> Optional[str]:
+    """
+    Ask the user for the URL of the job description.
+
+    :return: The entered URL, or None if the prompt was interrupted.
+    """
+    import inquirer
+
+    questions = [inquirer.Text('job_url', message="Please enter the URL of the job description:")]
+    answers = inquirer.prompt(questions)
+    return answers.get('job_url') if answers else None
+
+def select_style(style_name=None):
+    """
+    Create a StyleManager and apply the requested style, prompting the user if none was given.
+
+    :param style_name: Optional style name from the command line.
+    :return: Tuple of the configured StyleManager and the effective style name.
+    """
+    from src.libs.resume_and_cover_builder import StyleManager
+
+    style_manager = StyleManager()
+
+    # Set style if provided, otherwise prompt
+    if style_name and style_name in STYLE_MAPPING.keys():
+        style_manager.set_selected_style(style_name)
+        logger.info(f"Using selected style: {style_name}")
+    else:
+        selected_style = prompt_style_selection(style_manager)
+        if selected_style:
+            style_manager.set_selected_style(selected_style)
+            style_name = selected_style
+        else:
+            logger.warning("No style selected. Proceeding with default style.")
+            style_name = "default"
+    return style_manager, style_name
+
+def get_driver():
+    """
+    Return the browser driver shared by all generations in this process.
+
+    Chrome is started on first use; later calls clear its cookies and reuse it.
+    If the previous session is no longer usable, a new browser is started.
+
+    :return: The Selenium WebDriver instance.
+    """
+    global _DRIVER
+    if _DRIVER is not None:
+        from selenium.common.exceptions import WebDriverException
+
+        try:
+            _DRIVER.delete_all_cookies()
+            return _DRIVER
+        except WebDriverException as e:
+            logger.warning(f"Browser session is no longer usable, starting a new one: {e}")
+            quit_driver()
+
+    from src.utils.chrome_utils import init_browser
+
+    _DRIVER = init_browser()
+    return _DRIVER
+
+@atexit.register
+def quit_driver():
+    """Shut down the shared browser driver, if one was started."""
+    global _DRIVER
+    if _DRIVER is not None:
+        try:
+            _DRIVER.quit()
+        except Exception as e:
+            logger.debug(f"Error while closing the browser: {e}")
+        _DRIVER = None
+
+@functools.lru_cache(maxsize=4)
+def load_resume(resume_path: str, mtime_ns: int):
+    """
+    Parse the plain text resume, memoized on its path and modification time.
+
+    :param resume_path: Path to the plain text resume YAML.
+    :param mtime_ns: Modification time of the file, used to invalidate the cache.
+    :return: The parsed Resume object.
+    """
+    from src.resume_schemas.resume import Resume
+
+    with open(resume_path, "r", encoding="utf-8") as file:
+        return Resume(file.read())
+
+def build_resume_facade(parameters: dict, llm_api_key: str, style_manager):
+    """
+    Build a ResumeFacade with the parsed resume and a browser driver attached.
+
+    :param parameters: Configuration parameters dictionary.
+    :param llm_api_key: API key for the language model.
+    :param style_manager: The StyleManager holding the selected style.
+    :return: The ready-to-use ResumeFacade.
+    """
+    # Deferred so that --help and configuration errors don't pay for these imports
+    from src.libs.resume_and_cover_builder import ResumeFacade, ResumeGenerator
+
+    resume_path = parameters["uploads"]["plainTextResume"]
+    resume_object = load_resume(str(resume_path), os.stat(resume_path).st_mtime_ns)
+
+    resume_generator = ResumeGenerator()
+    driver = get_driver()
+    resume_generator.set_resume_object(resume_object)
+
+    resume_facade = ResumeFacade(
+        api_key=llm_api_key,
+        style_manager=style_manager,
+        resume_generator=resume_generator,
+        resume_object=resume_object,
+        output_path=Path("data_folder/output"),
+    )
+    resume_facade.set_driver(driver)
+    return resume_facade
+
+def save_pdf(result_base64: str, output_path: Path):
+    """
+    Decode a base64-encoded PDF and write it to disk.
+
+    The payload is decoded in fixed-size slices so the full decoded document is
+    never held in memory next to its base64 form. Output goes to a temporary file
+    beside output_path that only replaces it once decoding and writing succeed, so
+    an invalid payload never clobbers an existing file.
+
+    :param result_base64: The PDF as a base64 string.
+    :param output_path: Destination file path.
+    """
+    # b64decode silently skips characters outside the alphabet (e.g. line breaks);
+    # drop them up front so every slice stays aligned to 4-character groups
+    result_base64 = BASE64_IGNORED_CHARS.sub("", result_base64)
+    try:
+        fd, temp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    except IOError as e:
+        logger.error("Error writing file: %s", e)
+        raise
+    try:
+        # mkstemp creates the file as 0600; give the PDF the usual umask-derived mode
+        umask = os.umask(0)
+        os.umask(umask)
+        with os.fdopen(fd, "wb") as file:
+            os.fchmod(file.fileno(), 0o666 & ~umask)
+            for start in range(0, len(result_base64), PDF_DECODE_CHUNK_SIZE):
+                file.write(base64.b64decode(result_base64[start:start + PDF_DECODE_CHUNK_SIZE]))
+        os.replace(temp_name, output_path)
+    except binascii.Error as e:
+        logger.error("Error decoding Base64: %s", e)
+        os.unlink(temp_name)
+        raise
+    except IOError as e:
+        logger.error("Error writing file: %s", e)
+        if os.path.exists(temp_name):
+            os.unlink(temp_name)
+        raise
+
+def create_resume_pdf(parameters: dict, llm_api_key: str, style_name=None, job_url=None, output_filename=None):
     """
     Logic to create a CV.
+
+    ``job_url`` is accepted for signature parity with the job-tailored actions and is ignored.
     """
     try:
         logger.info("Generating a CV based on provided parameters.")
 
-        # Load the plain text resume
-        with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-            plain_text_resume = file.read()
+        style_manager, style_name = select_style(style_name)
 
-        # Initialize StyleManager
-        style_manager = StyleManager()
-        
-        # Set style if provided, otherwise prompt
-        if style_name and style_name in STYLE_MAPPING.keys():
-            style_manager.set_selected_style(style_name)
-            logger.info(f"Using selected style: {style_name}")
-        else:
-            selected_style = prompt_style_selection(style_manager)
-            if selected_style:
-                style_manager.set_selected_style(selected_style)
-                style_name = selected_style
-            else:
-                logger.warning("No style selected. Proceeding with default style.")
-                style_name = "default"
-
-        # Initialize the Resume Generator
-        resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
-        driver = init_browser()
-        resume_generator.set_resume_object(resume_object)
-
-        # Create the ResumeFacade
-        resume_facade = ResumeFacade(
-            api_key=llm_api_key,
-            style_manager=style_manager,
-            resume_generator=resume_generator,
-            resume_object=resume_object,
-            output_path=Path("data_folder/output"),
-        )
-        resume_facade.set_driver(driver)
+        # Create facade and process
+        resume_facade = build_resume_facade(parameters, llm_api_key, style_manager)
         result_base64 = resume_facade.create_resume_pdf()
 
-        # Decode Base64 to binary data
-        try:
-            pdf_data = base64.b64decode(result_base64)
-        except base64.binascii.Error as e:
-            logger.error("Error decoding Base64: %s", e)
-            raise
-
         # Define the output filename
         if not output_filename:
             output_filename = get_output_filename("Generate Resume", style_name)
@@ -363,15 +607,10 @@ def create_resume_pdf(parameters: dict, llm_api_key: str, style_name=None, outpu
         # Define the output directory
         output_dir = Path(parameters["outputFileDirectory"])
 
-        # Write the PDF file
+        # Decode and write the PDF file
         output_path = output_dir / output_filename
-        try:
-            with open(output_path, "wb") as file:
-                file.write(pdf_data)
-            logger.info(f"Resume saved at: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            raise
+        save_pdf(result_base64, output_path)
+        logger.info(f"Resume saved at: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the CV: {e}")
         raise
@@ -383,57 +622,17 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str, style_nam
     try:
         logger.info("Generating a job-tailored CV based on provided parameters.")
 
-        # Load the plain text resume
-        with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-            plain_text_resume = file.read()
+        style_manager, style_name = select_style(style_name)
 
-        # Initialize StyleManager
-        style_manager = StyleManager()
-        
-        # Set style if provided, otherwise prompt
-        if style_name and style_name in STYLE_MAPPING.keys():
-            style_manager.set_selected_style(style_name)
-            logger.info(f"Using selected style: {style_name}")
-        else:
-            selected_style = prompt_style_selection(style_manager)
-            if selected_style:
-                style_manager.set_selected_style(selected_style)
-                style_name = selected_style
-            else:
-                logger.warning("No style selected. Proceeding with default style.")
-                style_name = "default"
-                
         # Prompt for job URL if not provided
         if not job_url:
-            questions = [inquirer.Text('job_url', message="Please enter the URL of the job description:")]
-            answers = inquirer.prompt(questions)
-            job_url = answers.get('job_url')
-            
-        # Initialize components
-        resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
-        driver = init_browser()
-        resume_generator.set_resume_object(resume_object)
-        
+            job_url = prompt_job_url()
+
         # Create facade and process
-        resume_facade = ResumeFacade(            
-            api_key=llm_api_key,
-            style_manager=style_manager,
-            resume_generator=resume_generator,
-            resume_object=resume_object,
-            output_path=Path("data_folder/output"),
-        )
-        resume_facade.set_driver(driver)
+        resume_facade = build_resume_facade(parameters, llm_api_key, style_manager)
         resume_facade.link_to_job(job_url)
         result_base64, suggested_name = resume_facade.create_resume_pdf_job_tailored()         
 
-        # Decode Base64 to binary data
-        try:
-            pdf_data = base64.b64decode(result_base64)
-        except base64.binascii.Error as e:
-            logger.error("Error decoding Base64: %s", e)
-            raise
-
         # Define the output filename
         if not output_filename:
             output_filename = get_output_filename("Generate Resume Tailored for Job Description", style_name)
@@ -442,15 +641,10 @@ def create_resume_pdf_job_tailored(parameters: dict, llm_api_key: str, style_nam
         output_dir = Path(parameters["outputFileDirectory"]) / suggested_name
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Write the PDF file
+        # Decode and write the PDF file
         output_path = output_dir / output_filename
-        try:
-            with open(output_path, "wb") as file:
-                file.write(pdf_data)
-            logger.info(f"Resume saved at: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            raise
+        save_pdf(result_base64, output_path)
+        logger.info(f"Resume saved at: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the CV: {e}")
         raise
@@ -462,57 +656,17 @@ def create_cover_letter(parameters: dict, llm_api_key: str, style_name=None, job
     try:
         logger.info("Generating a cover letter based on provided parameters.")
 
-        # Load the plain text resume
-        with open(parameters["uploads"]["plainTextResume"], "r", encoding="utf-8") as file:
-            plain_text_resume = file.read()
+        style_manager, style_name = select_style(style_name)
 
-        # Initialize StyleManager
-        style_manager = StyleManager()
-        
-        # Set style if provided, otherwise prompt
-        if style_name and style_name in STYLE_MAPPING.keys():
-            style_manager.set_selected_style(style_name)
-            logger.info(f"Using selected style: {style_name}")
-        else:
-            selected_style = prompt_style_selection(style_manager)
-            if selected_style:
-                style_manager.set_selected_style(selected_style)
-                style_name = selected_style
-            else:
-                logger.warning("No style selected. Proceeding with default style.")
-                style_name = "default"
-                
         # Prompt for job URL if not provided
         if not job_url:
-            questions = [inquirer.Text('job_url', message="Please enter the URL of the job description:")]
-            answers = inquirer.prompt(questions)
-            job_url = answers.get('job_url')
-            
-        # Initialize components
-        resume_generator = ResumeGenerator()
-        resume_object = Resume(plain_text_resume)
-        driver = init_browser()
-        resume_generator.set_resume_object(resume_object)
-        
+            job_url = prompt_job_url()
+
         # Create facade and process
-        resume_facade = ResumeFacade(            
-            api_key=llm_api_key,
-            style_manager=style_manager,
-            resume_generator=resume_generator,
-            resume_object=resume_object,
-            output_path=Path("data_folder/output"),
-        )
-        resume_facade.set_driver(driver)
+        resume_facade = build_resume_facade(parameters, llm_api_key, style_manager)
         resume_facade.link_to_job(job_url)
         result_base64, suggested_name = resume_facade.create_cover_letter()         
 
-        # Decode Base64 to binary data
-        try:
-            pdf_data = base64.b64decode(result_base64)
-        except base64.binascii.Error as e:
-            logger.error("Error decoding Base64: %s", e)
-            raise
-
         # Define the output filename
         if not output_filename:
             output_filename = get_output_filename("Generate Tailored Cover Letter for Job Description", style_name)
@@ -521,19 +675,30 @@ def create_cover_letter(parameters: dict, llm_api_key: str, style_name=None, job
         output_dir = Path(parameters["outputFileDirectory"]) / suggested_name
         output_dir.mkdir(parents=True, exist_ok=True)
         
-        # Write the PDF file
+        # Decode and write the PDF file
         output_path = output_dir / output_filename
-        try:
-            with open(output_path, "wb") as file:
-                file.write(pdf_data)
-            logger.info(f"Cover letter saved at: {output_path}")
-        except IOError as e:
-            logger.error("Error writing file: %s", e)
-            raise
+        save_pdf(result_base64, output_path)
+        logger.info(f"Cover letter saved at: {output_path}")
     except Exception as e:
         logger.exception(f"An error occurred while creating the cover letter: {e}")
         raise
     
+# Maps each action label to its progress message and document builder
+ACTION_HANDLERS = {
+    ACTION_MAPPING["resume"]: (
+        "Crafting a standout professional resume...",
+        create_resume_pdf,
+    ),
+    ACTION_MAPPING["job"]: (
+        "Customizing your resume to enhance your job application...",
+        create_resume_pdf_job_tailored,
+    ),
+    ACTION_MAPPING["cover"]: (
+        "Designing a personalized cover letter to enhance your job application...",
+        create_cover_letter,
+    ),
+}
+
 def handle_inquiries(selected_actions: str, parameters: dict, llm_api_key: str, style=None, job_url=None, output_filename=None):
     """
     Decide which function to call based on the selected user actions.
@@ -547,17 +712,11 @@ def handle_inquiries(selected_actions: str, parameters: dict, llm_api_key: str,
     """
     try:
         if selected_actions:
-            if "Generate Resume" == selected_actions:
-                logger.info("Crafting a standout professional resume...")
-                create_resume_pdf(parameters, llm_api_key, style, output_filename)
-                
-            if "Generate Resume Tailored for Job Description" == selected_actions:
-                logger.info("Customizing your resume to enhance your job application...")
-                create_resume_pdf_job_tailored(parameters, llm_api_key, style, job_url, output_filename)
-                
-            if "Generate Tailored Cover Letter for Job Description" == selected_actions:
-                logger.info("Designing a personalized cover letter to enhance your job application...")
-                create_cover_letter(parameters, llm_api_key, style, job_url, output_filename)
+            handler = ACTION_HANDLERS.get(selected_actions)
+            if handler:
+                message, create_document = handler
+                logger.info(message)
+                create_document(parameters, llm_api_key, style, job_url, output_filename)
         else:
             logger.warning("No actions selected. Nothing to execute.")
     except Exception as e:
@@ -579,8 +738,8 @@ def main(action=None, style=None, job_url=None, filename=None):
         secrets_file, config_file, plain_text_resume_file, output_folder = FileManager.validate_data_folder(data_folder)
 
         # Validate configuration and secrets
-        config = ConfigValidator.validate_config(config_file)
-        llm_api_key = ConfigValidator.validate_secrets(secrets_file)
+        config = validate_config_cached(config_file, output_folder / VALIDATOR_CACHE_DIR)
+        llm_api_key = validate_secrets(secrets_file)
 
         # Prepare parameters
         config["uploads"] = FileManager.get_uploads(plain_text_resume_file)
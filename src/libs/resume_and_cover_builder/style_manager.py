@@ -8,6 +8,9 @@ logging.basicConfig(level=logging.DEBUG, format="%(asctime)s - %(levelname)s - %
 
 
 class StyleManager:
+    # Styles parsed per directory, shared by all instances for the lifetime of the process
+    _styles_cache: Dict[Path, Dict[str, Tuple[str, str]]] = {}
+
     def __init__(self):
         self.selected_style: Optional[str] = None
         current_file = Path(__file__).resolve()
@@ -20,6 +23,7 @@ class StyleManager:
     def get_styles(self) -> Dict[str, Tuple[str, str]]:
         """
         Retrieve the available styles from the styles directory.
+        The directory is only scanned once per process; later calls reuse the result.
         Returns:
             Dict[str, Tuple[str, str]]: A dictionary mapping style names to their file names and author links.
         """
@@ -27,6 +31,9 @@ class StyleManager:
         if not self.styles_directory:
             logging.warning("Styles directory is not set.")
             return styles_to_files
+        cached_styles = StyleManager._styles_cache.get(self.styles_directory)
+        if cached_styles is not None:
+            return dict(cached_styles)
         logging.debug(f"Reading styles directory: {self.styles_directory}")
         try:
             files = [f for f in self.styles_directory.iterdir() if f.is_file()]
@@ -44,6 +51,7 @@ class StyleManager:
                             author_link = author_link.strip()
                             styles_to_files[style_name] = (file_path.name, author_link)
                             logging.info(f"Added style: {style_name} by {author_link}")
+            StyleManager._styles_cache[self.styles_directory] = dict(styles_to_files)
         except FileNotFoundError:
             logging.error(f"Directory {self.styles_directory} not found.")
         except PermissionError: